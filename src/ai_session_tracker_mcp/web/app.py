@@ -8,11 +8,11 @@ AI CONTEXT: Creates app with all routes registered.
 from __future__ import annotations
 
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
-import uvicorn
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
@@ -60,7 +60,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001
     logger.info("AI Session Tracker dashboard shutting down")
 
 
-def create_app() -> FastAPI:
+def create_app(**fastapi_kwargs: Any) -> FastAPI:
     """
     Create and configure the FastAPI dashboard application.
 
@@ -72,11 +72,17 @@ def create_app() -> FastAPI:
     both HTML pages for human viewing and JSON APIs for programmatic access
     to session tracking data and analytics.
 
+    Args:
+        **fastapi_kwargs: Extra keyword arguments forwarded to the FastAPI
+            constructor, overriding the defaults below. Tests pass
+            openapi_url=None, docs_url=None, redoc_url=None to skip the
+            OpenAPI/docs machinery.
+
     Returns:
         Configured FastAPI application instance with:
         - All dashboard routes registered (/, /partials/*, /charts/*, /api/*)
         - Static files mounted at /static if the static directory exists
-        - OpenAPI documentation available at /docs
+        - OpenAPI documentation available at /docs (unless disabled)
         - Metadata including title, description, and version
 
     Raises:
@@ -95,12 +101,14 @@ def create_app() -> FastAPI:
         >>> response.status_code
         200
     """
-    app = FastAPI(
-        title="AI Session Tracker",
-        description="Dashboard for tracking AI coding sessions and ROI",
-        version=__version__,
-        lifespan=lifespan,
-    )
+    settings: dict[str, Any] = {
+        "title": "AI Session Tracker",
+        "description": "Dashboard for tracking AI coding sessions and ROI",
+        "version": __version__,
+        "lifespan": lifespan,
+    }
+    settings.update(fastapi_kwargs)
+    app = FastAPI(**settings)
 
     # Include routes
     app.include_router(router)
@@ -118,6 +126,7 @@ def run_dashboard(
     port: int = 8000,
     reload: bool = False,
     log_level: str = "info",
+    _runner: Callable[..., None] | None = None,
 ) -> None:
     """
     Launch the AI Session Tracker web dashboard server.
@@ -139,6 +148,10 @@ def run_dashboard(
             Should be False in production for stability.
         log_level: Uvicorn logging verbosity. One of 'critical', 'error',
             'warning', 'info' (default), 'debug', or 'trace'.
+        _runner: Server entry point invoked with the uvicorn arguments.
+            Defaults to uvicorn.run, imported lazily so that importing
+            this module does not load the server stack; tests inject a
+            stub to avoid starting a real server.
 
     Returns:
         None. This function blocks until the server is stopped (Ctrl+C).
@@ -155,7 +168,11 @@ def run_dashboard(
         >>> # Start production server (accessible on network)
         >>> run_dashboard(host='0.0.0.0', port=80)
     """
-    uvicorn.run(
+    if _runner is None:
+        import uvicorn
+
+        _runner = uvicorn.run
+    _runner(
         "ai_session_tracker_mcp.web.app:create_app",
         factory=True,
         host=host,
@@ -165,6 +182,26 @@ def run_dashboard(
     )
 
 
+def _main() -> None:
+    """
+    Entry point for `python -m ai_session_tracker_mcp.web.app`.
+
+    Starts the dashboard with run_dashboard() defaults. Kept as a function
+    so the direct-execution path can be called and tested without
+    re-executing this module as __main__.
+
+    Returns:
+        None. Blocks until the server is stopped.
+
+    Raises:
+        OSError: If the default port is already in use.
+
+    Example:
+        >>> _main()  # Serves http://127.0.0.1:8000 until Ctrl+C
+    """
+    run_dashboard()
+
+
 # For direct execution
 if __name__ == "__main__":
-    run_dashboard()
+    _main()
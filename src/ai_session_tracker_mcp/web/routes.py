@@ -14,6 +14,7 @@ ROUTE STRUCTURE:
 from __future__ import annotations
 
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING, Annotated
 
 from fastapi import APIRouter, Depends, Request
@@ -234,35 +235,49 @@ def get_statistics() -> StatisticsEngine:
     return StatisticsEngine()
 
 
-def get_dashboard_presenter() -> DashboardPresenter:
+def get_dashboard_presenter(
+    storage: Annotated[StorageManager, Depends(get_storage)],
+    statistics: Annotated[StatisticsEngine, Depends(get_statistics)],
+) -> DashboardPresenter:
     """
     Create and return a DashboardPresenter with dependencies.
 
     Factory function that assembles the dashboard presenter with its
     required storage and statistics dependencies. The presenter
     transforms raw data into view models for template rendering.
+    Both dependencies are resolved through FastAPI Depends, so tests
+    can replace them via app.dependency_overrides. Callers outside a
+    request must pass both arguments explicitly.
 
     Business context: The presenter pattern separates data transformation
     from route handling, enabling testable business logic and clean
     separation of concerns between data access and presentation.
 
+    Args:
+        storage: StorageManager injected via Depends(get_storage).
+        statistics: StatisticsEngine injected via Depends(get_statistics).
+
     Returns:
         DashboardPresenter instance with injected StorageManager and
         StatisticsEngine, ready to generate view models for sessions,
         ROI, effectiveness, and issue displays.
 
     Raises:
-        OSError: If storage cannot be initialized.
+        None: Only wires the injected dependencies together; storage
+            errors surface from get_storage().
 
     Example:
-        >>> presenter = get_dashboard_presenter()
+        >>> presenter = get_dashboard_presenter(get_storage(), get_statistics())
         >>> overview = presenter.get_overview()
         >>> print(f"Total sessions: {len(overview.sessions)}")
     """
-    return DashboardPresenter(get_storage(), get_statistics())
+    return DashboardPresenter(storage, statistics)
 
 
-def get_chart_presenter() -> ChartPresenter:
+def get_chart_presenter(
+    storage: Annotated[StorageManager, Depends(get_storage)],
+    statistics: Annotated[StatisticsEngine, Depends(get_statistics)],
+) -> ChartPresenter:
     """
     Create and return a ChartPresenter with dependencies.
 
@@ -273,6 +288,12 @@ def get_chart_presenter() -> ChartPresenter:
     Business context: Visual charts (effectiveness bars, ROI comparison,
     timeline) provide quick insights for stakeholders. Server-side
     rendering ensures consistent appearance across all clients.
+    Dependencies are resolved through FastAPI Depends; callers outside
+    a request must pass both arguments explicitly.
+
+    Args:
+        storage: StorageManager injected via Depends(get_storage).
+        statistics: StatisticsEngine injected via Depends(get_statistics).
 
     Returns:
         ChartPresenter instance with injected StorageManager and
@@ -280,16 +301,17 @@ def get_chart_presenter() -> ChartPresenter:
         distribution, ROI comparison, and session timeline.
 
     Raises:
-        OSError: If storage cannot be initialized.
-        ImportError: If matplotlib is not available (graceful fallback).
+        None: Only wires the injected dependencies together. matplotlib
+            is imported lazily, so a missing install raises ImportError
+            from the render methods, not here.
 
     Example:
-        >>> presenter = get_chart_presenter()
+        >>> presenter = get_chart_presenter(get_storage(), get_statistics())
         >>> png_bytes = presenter.render_effectiveness_chart()
         >>> len(png_bytes) > 0
         True
     """
-    return ChartPresenter(get_storage(), get_statistics())
+    return ChartPresenter(storage, statistics)
 
 
 # ============================================================================
@@ -300,6 +322,7 @@ def get_chart_presenter() -> ChartPresenter:
 @router.get("/", response_class=HTMLResponse)
 async def dashboard_page(
     presenter: Annotated[DashboardPresenter, Depends(get_dashboard_presenter)],
+    storage: Annotated[StorageManager, Depends(get_storage)],
     request: Request,  # noqa: ARG001
 ) -> HTMLResponse:
     """
@@ -315,6 +338,8 @@ async def dashboard_page(
 
     Args:
         presenter: DashboardPresenter injected via FastAPI Depends.
+        storage: StorageManager injected via FastAPI Depends; the same
+            instance the presenter uses, read for the token stats panel.
         request: FastAPI Request object (unused but kept for potential
             future enhancements like user context).
 
@@ -337,7 +362,7 @@ async def dashboard_page(
     overview = presenter.get_overview()
 
     # Inline template for simplicity (could move to Jinja2 file)
-    html = _render_dashboard_html(overview)
+    html = _render_dashboard_html(overview, storage)
     return HTMLResponse(content=html, media_type="text/html; charset=utf-8")
 
 
@@ -720,6 +745,7 @@ async def timeline_chart(
 @router.get("/api/overview")
 async def api_overview(
     presenter: Annotated[DashboardPresenter, Depends(get_dashboard_presenter)],
+    storage: Annotated[StorageManager, Depends(get_storage)],
 ) -> dict[str, object]:
     """
     Get complete dashboard data as JSON for programmatic access.
@@ -732,6 +758,11 @@ async def api_overview(
     tools (Slack bots, custom dashboards, CI/CD pipelines) that
     want to consume session tracking data programmatically.
 
+    Args:
+        presenter: DashboardPresenter injected via FastAPI Depends.
+        storage: StorageManager injected via FastAPI Depends, read for
+            the aggregate token stats.
+
     Returns:
         Dict containing:
         - 'sessions': List of session objects with id, project, status,
@@ -786,7 +817,7 @@ async def api_overview(
                 overview.session_gaps.friction_indicators if overview.session_gaps else []
             ),
         },
-        "token_stats": SessionService._compute_token_stats(get_storage().load_interactions()),
+        "token_stats": SessionService._compute_token_stats(storage.load_interactions()),
     }
 
 
@@ -831,13 +862,16 @@ async def api_report(
 # ============================================================================
 
 
+@lru_cache(maxsize=8)
 def _placeholder_chart_svg(title: str) -> bytes:
     """
     Generate a placeholder SVG when matplotlib is unavailable.
 
     Creates a simple SVG image with centered text indicating that
     matplotlib needs to be installed for full chart functionality.
-    Used as graceful fallback for chart routes.
+    Used as graceful fallback for chart routes. Output depends only on
+    the title, so each chart's placeholder is built and encoded once per
+    process and the immutable bytes are reused on later requests.
 
     Business context: Graceful degradation ensures the dashboard remains
     functional even without optional visualization dependencies.
@@ -867,7 +901,7 @@ def _placeholder_chart_svg(title: str) -> bytes:
     return svg.encode("utf-8")
 
 
-def _render_dashboard_html(overview: object) -> str:
+def _render_dashboard_html(overview: object, storage: StorageManager) -> str:
     """
     Render the complete dashboard HTML page from overview data.
 
@@ -883,6 +917,8 @@ def _render_dashboard_html(overview: object) -> str:
         overview: DashboardOverview object containing sessions list,
             roi summary, effectiveness distribution, and report text.
             Type is 'object' for import cycle avoidance.
+        storage: StorageManager whose interactions feed the token
+            stats panel.
 
     Returns:
         Complete HTML string including DOCTYPE, head with styles and
@@ -893,9 +929,10 @@ def _render_dashboard_html(overview: object) -> str:
         None: Template construction never raises.
 
     Example:
-        >>> presenter = get_dashboard_presenter()
+        >>> storage = get_storage()
+        >>> presenter = get_dashboard_presenter(storage, get_statistics())
         >>> overview = presenter.get_overview()
-        >>> html = _render_dashboard_html(overview)
+        >>> html = _render_dashboard_html(overview, storage)
         >>> '<!DOCTYPE html>' in html
         True
     """
@@ -907,7 +944,6 @@ def _render_dashboard_html(overview: object) -> str:
     gaps_html = _render_gaps_panel(ov.session_gaps) if ov.session_gaps else ""
 
     # Compute token stats from all interactions
-    storage = get_storage()
     all_interactions = storage.load_interactions()
     token_stats = SessionService._compute_token_stats(all_interactions)
     token_stats_html = _render_token_stats_panel(token_stats)
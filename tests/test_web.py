@@ -2,27 +2,69 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
-
+import asyncio
+import functools
+import importlib.util
+import re
+import sys
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import fastapi
+import httpx
 import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from ai_session_tracker_mcp.presenters import (
+    EffectivenessViewModel,
+    ROIViewModel,
+    SessionGapsViewModel,
+    SessionViewModel,
+)
+from ai_session_tracker_mcp.web import app as web_app
+from ai_session_tracker_mcp.web import create_app, run_dashboard
+from ai_session_tracker_mcp.web.app import lifespan
+from ai_session_tracker_mcp.web.routes import (
+    get_chart_presenter,
+    get_dashboard_presenter,
+    get_storage,
+)
+
+# Every test here runs against the in-process app, so the module can be
+# distributed with pytest-xdist (--dist=loadfile keeps it on one worker).
+# Each request completes in milliseconds; a 5s pytest-timeout turns a hung
+# route or dependency override into a failure rather than a stalled run.
+pytestmark = [pytest.mark.unit, pytest.mark.timeout(5)]
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_app() -> fastapi.FastAPI:
+    """Build the test app once per process.
+
+    create_app() is deterministic, so the session client and the factory
+    tests share a single instance. OpenAPI and docs routes are disabled
+    because no test requests them.
 
-# Skip all tests if FastAPI not installed
-fastapi = pytest.importorskip("fastapi")
-
-if TYPE_CHECKING:
-    from fastapi.testclient import TestClient
-
-from ai_session_tracker_mcp.storage import StorageManager  # noqa: E402
-from ai_session_tracker_mcp.web import create_app  # noqa: E402
+    Returns:
+        FastAPI: The dashboard app shared by all tests in this module.
+    """
+    return create_app(openapi_url=None, docs_url=None, redoc_url=None)
 
 
-@pytest.fixture
-def client() -> TestClient:
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
     """Create FastAPI test client for HTTP endpoint testing.
 
-    Provides a TestClient instance wrapping the web application,
-    enabling synchronous HTTP request testing without running a server.
+    Provides one TestClient wrapping the web application for the whole
+    session, enabling synchronous HTTP request testing without running a
+    server. App construction and the lifespan startup/shutdown run once;
+    tests isolate their data through the stub_storage and stub_presenter
+    fixtures rather than through a fresh app.
 
     Business context:
     The web dashboard is the primary user interface for viewing session
@@ -34,7 +76,7 @@ def client() -> TestClient:
     Raises:
         No exceptions raised by this fixture.
 
-    Returns:
+    Yields:
         TestClient: Starlette TestClient wrapping the FastAPI app,
         configured for making test requests to all dashboard routes.
 
@@ -43,64 +85,394 @@ def client() -> TestClient:
         >>> assert response.status_code == 200
         >>> assert 'AI Session Tracker' in response.text
     """
-    from fastapi.testclient import TestClient as TC
+    with TestClient(_cached_app()) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient(client: TestClient) -> AsyncIterator[httpx.AsyncClient]:
+    """Create an async HTTP client driving the shared app in-process.
+
+    Wraps the session client's app in httpx.ASGITransport so requests
+    await the ASGI app directly on the test's event loop, skipping
+    TestClient's thread portal hop. Sharing the app keeps dependency
+    overrides consistent between the sync and async clients.
+
+    Business context:
+    The JSON API and htmx partial endpoints are the highest-volume
+    routes; their tests should carry the least per-request overhead.
+
+    Args:
+        client: Session-scoped TestClient whose app is reused.
+
+    Raises:
+        No exceptions raised by this fixture.
+
+    Yields:
+        httpx.AsyncClient: Client bound to the dashboard app.
+
+    Example:
+        >>> response = await aclient.get('/api/overview')
+        >>> assert response.status_code == 200
+    """
+    transport = httpx.ASGITransport(app=client.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@dataclass(frozen=True)
+class _StubStorage:
+    """Minimal stand-in for StorageManager in route tests.
+
+    Route handlers and presenters only call load_sessions(),
+    load_interactions() and load_issues(), so a frozen dataclass returning
+    fixed collections replaces MagicMock(spec=StorageManager) and its
+    per-instance spec introspection. Freezing keeps a stub from being
+    rebound to other data once a test has handed it to the app.
+
+    Attributes:
+        sessions: Mapping returned by load_sessions(). Defaults to {}.
+        interactions: List returned by load_interactions(). Defaults to [].
+        issues: List returned by load_issues(). Defaults to [].
+
+    Example:
+        >>> storage = _StubStorage().with_interactions({"effectiveness_rating": 5})
+        >>> storage.load_sessions()
+        {}
+    """
+
+    sessions: dict[str, object] = field(default_factory=dict)
+    interactions: list[dict[str, object]] = field(default_factory=list)
+    issues: list[dict[str, object]] = field(default_factory=list)
+
+    def with_sessions(self, **sessions: object) -> _StubStorage:
+        """Return a copy of this stub with sessions added by session ID.
+
+        Args:
+            **sessions: Session records keyed by session ID; merged over
+                the existing sessions.
+
+        Returns:
+            _StubStorage: New stub; this instance is left unchanged.
+
+        Example:
+            >>> _StubStorage().with_sessions(s1={"project": "p"}).load_sessions()
+            {'s1': {'project': 'p'}}
+        """
+        return replace(self, sessions={**self.sessions, **sessions})
+
+    def with_interactions(self, *interactions: dict[str, object]) -> _StubStorage:
+        """Return a copy of this stub with interactions appended.
+
+        Args:
+            *interactions: Interaction records appended in order.
+
+        Returns:
+            _StubStorage: New stub; this instance is left unchanged.
+
+        Example:
+            >>> len(_StubStorage().with_interactions({}, {}).load_interactions())
+            2
+        """
+        return replace(self, interactions=[*self.interactions, *interactions])
+
+    def load_sessions(self) -> dict[str, object]:
+        """Return the stubbed sessions mapping."""
+        return self.sessions
+
+    def load_interactions(self) -> list[dict[str, object]]:
+        """Return the stubbed interactions list."""
+        return self.interactions
+
+    def load_issues(self) -> list[dict[str, object]]:
+        """Return the stubbed issues list."""
+        return self.issues
+
+
+# Sample storage contents shared by data-backed tests. Read-only by
+# convention: routes and presenters only read what storage returns.
+_SAMPLE_SESSIONS: dict[str, object] = {
+    "s1": {
+        "project": "myproject",
+        "status": "completed",
+        "start_time": "2024-01-01T10:00:00Z",
+        "end_time": "2024-01-01T11:00:00Z",
+    }
+}
+_SAMPLE_INTERACTIONS: list[dict[str, object]] = [{"session_id": "s1", "effectiveness_rating": 5}]
+
+# Presenter view models returned by stub_presenter in the HTMX partial
+# tests. Built once at import; the partial renderers only read them.
+_SAMPLE_GAPS_VIEWMODEL = SessionGapsViewModel(
+    total_gaps=3,
+    average_gap_minutes=15.0,
+    by_classification={"quick": 1, "normal": 2},
+    friction_indicators=[],
+)
+_FRICTION_GAPS_VIEWMODEL = SessionGapsViewModel(
+    total_gaps=5,
+    average_gap_minutes=90.0,
+    by_classification={"long_break": 3, "normal": 2},
+    friction_indicators=[
+        "High long-break ratio (60%)",
+        "Average gap exceeds 60 minutes",
+    ],
+)
+_SAMPLE_SESSION_VIEWMODEL = SessionViewModel(
+    session_id="session-abc-123-xyz",
+    project="test-project",
+    status="completed",
+    duration_minutes=90.0,
+    interaction_count=5,
+    effectiveness_avg=4.0,
+    start_time="2024-01-01T10:00:00Z",
+    end_time="2024-01-01T11:30:00Z",
+)
+_SAMPLE_ROI_VIEWMODEL = ROIViewModel(
+    roi_percentage=150.0,
+    total_sessions=5,
+    completed_sessions=4,
+    total_ai_hours=5.0,
+    estimated_human_hours=10.0,
+    time_saved_hours=5.0,
+    human_baseline_cost=1000.0,
+    total_ai_cost=500.0,
+    cost_saved=500.0,
+    productivity_multiplier=2.0,
+)
+_SAMPLE_EFFECTIVENESS_VIEWMODEL = EffectivenessViewModel(
+    average=4.2,
+    total_interactions=10,
+    distribution={5: 5, 4: 3, 3: 2},
+)
+
+# Case-insensitive markers searched in raw partial bodies. The markup is
+# ASCII, so matching bytes avoids decoding and lower-casing each response.
+_FRICTION_RE = re.compile(rb"long-break ratio|warning", re.IGNORECASE)
+_COMPLETED_RE = re.compile(rb"completed", re.IGNORECASE)
+_TABLE_OR_EMPTY_RE = re.compile(rb"table|no sessions", re.IGNORECASE)
+
+# matplotlib is optional; find_spec checks for it without importing it.
+_HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class _MatplotlibMissingPresenter:
+    """ChartPresenter stand-in whose every render method raises ImportError.
+
+    Mimics ChartPresenter's behaviour when its lazy matplotlib import
+    fails, without building a MagicMock tree per test.
+
+    Example:
+        >>> _MatplotlibMissingPresenter().render_roi_chart()
+        Traceback (most recent call last):
+        ImportError: No matplotlib
+    """
+
+    def __getattr__(self, name: str) -> Callable[..., bytes]:
+        """Return a render callable that raises ImportError.
+
+        Args:
+            name: Requested attribute, e.g. 'render_roi_chart'.
+
+        Returns:
+            Callable accepting any arguments and raising ImportError.
+        """
+
+        def _raise(*_args: object, **_kwargs: object) -> bytes:
+            raise ImportError("No matplotlib")
+
+        return _raise
+
 
-    app = create_app()
-    return TC(app)
+@contextmanager
+def _override_dependency(
+    client: TestClient, dependency: Callable[..., object], value: object
+) -> Iterator[None]:
+    """Resolve a FastAPI dependency to a fixed value for the block's duration.
+
+    Single place that writes to the shared app's dependency_overrides, so
+    every override is removed again on exit and never leaks into the next
+    test, even if the block raises.
+
+    Args:
+        client: TestClient whose app receives the override.
+        dependency: Dependency callable used in Depends(), e.g. get_storage.
+        value: Object injected wherever the dependency is requested.
+
+    Yields:
+        None. The override is active inside the with-block.
+
+    Example:
+        >>> with _override_dependency(client, get_chart_presenter, presenter):
+        ...     client.get('/charts/roi.png')
+    """
+    client.app.dependency_overrides[dependency] = lambda: value
+    try:
+        yield
+    finally:
+        client.app.dependency_overrides.pop(dependency, None)
 
 
 @pytest.fixture
-def mock_storage() -> MagicMock:
-    """Create mock StorageManager with sample session data.
+def stub_storage(client: TestClient, request: pytest.FixtureRequest) -> Iterator[_StubStorage]:
+    """Override the routes' storage dependency with a _StubStorage.
 
-    Provides a MagicMock configured with realistic session, interaction,
-    and issue data for testing dashboard rendering and API responses.
+    get_storage is resolved through FastAPI Depends (directly and via the
+    presenter factories), so the stub is installed in the shared app's
+    dependency_overrides rather than by patching the module attribute.
+    Empty by default; tests needing data parametrize it indirectly with a
+    stub built through _StubStorage.with_sessions()/with_interactions().
 
     Business context:
-    Dashboard tests need predictable data to verify correct rendering.
-    Mock storage isolates tests from real persistence layer.
+    Route tests must never read the developer's real .ai_sessions data.
+    Stubbed storage keeps every response deterministic.
 
     Args:
-        No arguments required for this fixture.
+        client: TestClient whose app receives the override.
+        request: Pytest request; request.param (optional) holds the
+            _StubStorage to install.
+
+    Raises:
+        No exceptions raised by this fixture.
+
+    Yields:
+        _StubStorage: The stub injected wherever get_storage is a dependency.
+
+    Example:
+        >>> seeded = _StubStorage().with_sessions(s1={})
+        >>> @pytest.mark.parametrize("stub_storage", [seeded], indirect=True)
+        ... def test_with_data(client, stub_storage): ...
+    """
+    storage = getattr(request, "param", None) or _StubStorage()
+    with _override_dependency(client, get_storage, storage):
+        yield storage
+
+
+_SMOKE_URLS = (
+    "/",
+    "/partials/sessions",
+    "/partials/roi",
+    "/partials/effectiveness",
+    "/partials/gaps",
+    "/partials/token-stats",
+    "/partials/roi-chart",
+    "/partials/timeline-chart",
+    "/charts/effectiveness.png",
+    "/charts/roi.png",
+    "/charts/timeline.png",
+    "/api/overview",
+    "/api/report",
+)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def empty_responses(
+    client: TestClient, aclient: httpx.AsyncClient
+) -> dict[str, httpx.Response]:
+    """Fetch every read-only route once against empty storage.
+
+    Installs an empty _StubStorage override, hides matplotlib so the chart
+    routes take the SVG placeholder path, and gathers one GET per URL in
+    _SMOKE_URLS. Content tests read their response from the returned
+    mapping instead of dispatching the same request again.
+
+    Business context:
+    With no tracked data every read-only route must still render. The
+    responses are deterministic, so one fetch per route is enough for
+    the smoketest and for every content assertion.
+
+    Args:
+        client: Session TestClient whose app receives the storage override.
+        aclient: Async client that issues the requests in-process.
 
     Raises:
         No exceptions raised by this fixture.
 
     Returns:
-        MagicMock: StorageManager mock with pre-configured return values:
-        - load_sessions: One completed session with project and timestamps
-        - load_interactions: One interaction with effectiveness rating 4
-        - load_issues: Empty list (no issues)
+        dict[str, httpx.Response]: Response for each URL in _SMOKE_URLS.
 
     Example:
-        >>> storage = mock_storage()
-        >>> sessions = storage.load_sessions()
-        >>> assert 'session-1' in sessions
-        >>> assert sessions['session-1']['status'] == 'completed'
+        >>> response = empty_responses["/partials/roi"]
+        >>> "Productivity" in response.text
+        True
     """
-    storage = MagicMock(spec=StorageManager)
-    storage.load_sessions.return_value = {
-        "session-1": {
-            "project": "test-project",
-            "status": "completed",
-            "start_time": "2024-01-01T10:00:00Z",
-            "end_time": "2024-01-01T11:00:00Z",
-        }
-    }
-    storage.load_interactions.return_value = [
-        {"session_id": "session-1", "effectiveness_rating": 4}
-    ]
-    storage.load_issues.return_value = []
-    return storage
+    with (
+        _override_dependency(client, get_storage, _StubStorage()),
+        pytest.MonkeyPatch.context() as mp,
+    ):
+        # A None entry makes ChartPresenter's lazy import raise ImportError
+        mp.setitem(sys.modules, "matplotlib", None)
+        responses = await asyncio.gather(*(aclient.get(url) for url in _SMOKE_URLS))
+    return dict(zip(_SMOKE_URLS, responses, strict=True))
+
+
+def _presenter_stub(**method_returns: object) -> SimpleNamespace:
+    """Build a presenter stand-in whose methods return fixed values.
+
+    Partial routes only call one or two zero-argument presenter methods,
+    so plain callables replace a MagicMock's child-mock creation and call
+    recording.
+
+    Args:
+        **method_returns: Presenter method names mapped to the value each
+            should return.
+
+    Returns:
+        SimpleNamespace: Object exposing one zero-argument callable per
+        keyword.
+
+    Example:
+        >>> _presenter_stub(get_sessions_list=[]).get_sessions_list()
+        []
+    """
+    return SimpleNamespace(
+        **{name: (lambda value=value: value) for name, value in method_returns.items()}
+    )
+
+
+@pytest.fixture
+def stub_presenter(client: TestClient, request: pytest.FixtureRequest) -> Iterator[SimpleNamespace]:
+    """Override the dashboard presenter dependency with a _presenter_stub.
+
+    Routes receive the presenter through Depends(get_dashboard_presenter),
+    so the override goes through app.dependency_overrides; patching the
+    module attribute would not reach the already-bound dependency. Tests
+    parametrize it indirectly with the method return values they need.
+
+    Business context:
+    Partial-route tests control exactly which view models are rendered,
+    independent of storage and statistics.
+
+    Args:
+        client: TestClient whose app receives the override.
+        request: Pytest request; request.param maps presenter method
+            names to their return values.
+
+    Raises:
+        No exceptions raised by this fixture.
+
+    Yields:
+        SimpleNamespace: The stub injected as the dashboard presenter.
+
+    Example:
+        >>> @pytest.mark.parametrize(
+        ...     "stub_presenter", [{"get_sessions_list": []}], indirect=True
+        ... )
+        ... async def test_empty(aclient, stub_presenter): ...
+    """
+    presenter = _presenter_stub(**request.param)
+    with _override_dependency(client, get_dashboard_presenter, presenter):
+        yield presenter
 
 
 class TestWebAppCreation:
     """Test suite for web application factory function.
 
     Categories:
-    1. Factory Output - Correct type and structure (2 tests)
+    1. Factory Output - Correct type, structure and kwargs passthrough (3 tests)
 
-    Total: 2 tests verifying app creation produces valid FastAPI app.
+    Total: 3 tests verifying app creation produces valid FastAPI app.
     """
 
     def test_create_app_returns_fastapi(self) -> None:
@@ -114,19 +486,16 @@ class TestWebAppCreation:
         Factory pattern enables testing and configuration flexibility.
 
         Arrangement:
-        Import FastAPI class for type comparison.
+        Shared app from _cached_app(), built by create_app().
 
         Action:
-        Calls create_app factory function.
+        Reads the cached app.
 
         Assertion Strategy:
-        Validates return value is isinstance of FastAPI, confirming
+        Validates the app is an instance of FastAPI, confirming
         correct app type for ASGI deployment.
         """
-        from fastapi import FastAPI
-
-        app = create_app()
-        assert isinstance(app, FastAPI)
+        assert isinstance(_cached_app(), fastapi.FastAPI)
 
     def test_app_has_routes(self) -> None:
         """Verifies app has expected routes registered.
@@ -139,22 +508,47 @@ class TestWebAppCreation:
         Missing routes would break htmx partial updates.
 
         Arrangement:
-        Create app via factory.
+        Shared app from _cached_app(), built by create_app().
+
+        Action:
+        Collect route paths from app.routes into a set.
+
+        Assertion Strategy:
+        Validates root path ('/'), API overview, and report endpoints
+        are a subset of the registered paths.
+        """
+        routes = {r.path for r in _cached_app().routes}
+        assert {"/", "/api/overview", "/api/report"} <= routes
+
+    def test_create_app_forwards_fastapi_kwargs(self) -> None:
+        """Verifies create_app forwards keyword arguments to FastAPI.
+
+        Tests that overrides such as docs_url=None reach the FastAPI
+        constructor while the dashboard defaults stay in place.
+
+        Business context:
+        The test suite builds its app without the OpenAPI/docs routes;
+        the passthrough must not drop the dashboard's own metadata.
+
+        Arrangement:
+        None beyond the factory itself.
 
         Action:
-        Extract route paths from app.routes.
+        Calls create_app with openapi_url, docs_url and redoc_url set to None.
 
         Assertion Strategy:
-        Validates presence of root path ('/'), API overview, and
-        report endpoints in route list.
+        Validates the docs routes are absent and the default title and
+        dashboard routes are still present.
         """
-        app = create_app()
-        routes = [r.path for r in app.routes]
+        app = create_app(openapi_url=None, docs_url=None, redoc_url=None)
+        routes = {r.path for r in app.routes}
+        assert routes.isdisjoint({"/openapi.json", "/docs", "/redoc"})
         assert "/" in routes
-        assert "/api/overview" in routes
-        assert "/api/report" in routes
+        assert app.title == "AI Session Tracker"
 
-    def test_create_app_mounts_static_files_when_directory_exists(self) -> None:
+    def test_create_app_mounts_static_files_when_directory_exists(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Verifies create_app mounts static files when the static directory exists.
 
         Tests static asset mounting behavior by simulating a present static directory
@@ -186,29 +580,30 @@ class TestWebAppCreation:
         Validates conditional behavior branching, ensuring that static asset
         serving is only activated when the required directory is present.
         """
-        from pathlib import Path
-        from unittest.mock import MagicMock
-
         # Create a mock Path that reports exists() as True
         mock_static_dir = MagicMock(spec=Path)
         mock_static_dir.exists.return_value = True
 
-        with patch("ai_session_tracker_mcp.web.app.Path") as mock_path_cls:
-            # Make Path(__file__).parent / "static" return our mock
-            mock_path_instance = MagicMock()
-            mock_path_instance.__truediv__ = MagicMock(return_value=mock_static_dir)
-            mock_path_cls.return_value.parent = mock_path_instance
+        # Make Path(__file__).parent / "static" return our mock
+        mock_path_cls = MagicMock()
+        mock_path_instance = MagicMock()
+        mock_path_instance.__truediv__ = MagicMock(return_value=mock_static_dir)
+        mock_path_cls.return_value.parent = mock_path_instance
+        monkeypatch.setattr(web_app, "Path", mock_path_cls)
 
-            # Also patch StaticFiles to avoid actual file system access
-            with patch("ai_session_tracker_mcp.web.app.StaticFiles") as mock_static_files:
-                mock_static_files.return_value = MagicMock()
+        # Also patch StaticFiles to avoid actual file system access
+        mock_static_files = MagicMock()
+        monkeypatch.setattr(web_app, "StaticFiles", mock_static_files)
 
-                create_app()  # App creation triggers static file mounting
+        create_app()  # App creation triggers static file mounting
 
-                # Verify static files were mounted
-                mock_static_files.assert_called_once()
+        # Verify static files were mounted
+        mock_static_files.assert_called_once()
 
-    def test_lifespan_logs_startup_and_shutdown(self) -> None:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_lifespan_logs_startup_and_shutdown(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Verifies lifespan context manager logs startup and shutdown.
 
         Tests that the app lifespan hooks log appropriate messages on
@@ -219,445 +614,278 @@ class TestWebAppCreation:
         initialization. Critical for production monitoring.
 
         Arrangement:
-        Create app and capture log output.
+        Shared app from _cached_app() (lifespan only logs, so no fresh
+        app or TestClient is needed) and a mock logger to capture output.
 
         Action:
-        Enter and exit the lifespan context manager.
+        Enter and exit the lifespan context manager directly on the
+        session event loop.
 
         Assertion Strategy:
         Validates both startup and shutdown log messages are emitted
         with correct version and action information.
         """
+        mock_logger = MagicMock()
+        monkeypatch.setattr(web_app, "logger", mock_logger)
 
-        from ai_session_tracker_mcp.web.app import lifespan
-
-        app = create_app()
-
-        # Capture log output
-        with patch("ai_session_tracker_mcp.web.app.logger") as mock_logger:
-            import asyncio
-
-            async def run_lifespan() -> None:
-                """Execute lifespan context manager for testing.
-
-                Inner async helper that runs the complete app lifespan cycle
-                (startup → running → shutdown) to verify logging behavior.
-
-                Args:
-                    None: Uses app from enclosing scope.
-
-                Returns:
-                    None: Side effect is lifespan execution.
-
-                Raises:
-                    None: Exceptions propagate from lifespan handler.
+        async with lifespan(_cached_app()):
+            pass  # Simulate app running
 
-                Example:
-                    >>> asyncio.run(run_lifespan())  # Runs full lifecycle
+        # Verify startup log
+        startup_call = mock_logger.info.call_args_list[0]
+        assert "starting" in startup_call[0][0].lower()
 
-                Note:
-                    Inner function pattern enables async context in sync test.
-                """
-                async with lifespan(app):
-                    pass  # Simulate app running
-
-            asyncio.run(run_lifespan())
-
-            # Verify startup log
-            startup_call = mock_logger.info.call_args_list[0]
-            assert "starting" in startup_call[0][0].lower()
-
-            # Verify shutdown log
-            shutdown_call = mock_logger.info.call_args_list[1]
-            assert "shutting down" in shutdown_call[0][0].lower()
-
-    def test_run_dashboard_main_block(self) -> None:
-        """Verifies __main__ block calls run_dashboard correctly.
-
-        Tests that direct module execution triggers run_dashboard,
-        covering the if __name__ == '__main__' block.
-
-        Business context:
-        Direct execution via `python -m ai_session_tracker_mcp.web.app`
-        should start the dashboard server for quick development testing.
-
-        Arrangement:
-        Mock uvicorn.run to prevent actual server startup.
-
-        Action:
-        Execute the module's __main__ block by running the module code.
-
-        Assertion Strategy:
-        Validates uvicorn.run was called with the expected factory config,
-        confirming __main__ block executes correctly.
-        """
-        with patch("uvicorn.run") as mock_uvicorn:
-            # Execute the module's main block
-            import runpy
-
-            runpy.run_module(
-                "ai_session_tracker_mcp.web.app",
-                run_name="__main__",
-                alter_sys=False,
-            )
-            mock_uvicorn.assert_called_once_with(
-                "ai_session_tracker_mcp.web.app:create_app",
-                factory=True,
-                host="127.0.0.1",
-                port=8000,
-                reload=False,
-                log_level="info",
-            )
+        # Verify shutdown log
+        shutdown_call = mock_logger.info.call_args_list[1]
+        assert "shutting down" in shutdown_call[0][0].lower()
 
 
 class TestDashboardPage:
     """Test suite for main dashboard page route.
 
     Categories:
-    1. Response Format - HTML content type and structure (3 tests)
+    1. Response Format - HTML content type, title and htmx (1 test)
 
-    Total: 3 tests verifying dashboard renders correctly.
+    Total: 1 test verifying dashboard renders correctly.
     """
 
-    def test_dashboard_page_returns_html(self, client: TestClient) -> None:
-        """Verifies dashboard route returns HTML content.
-
-        Tests that GET / returns HTTP 200 with HTML content type,
-        the basic contract for a web dashboard page.
-
-        Business context:
-        Dashboard is the primary UI for viewing session analytics.
-        Must return valid HTML for browser rendering.
-
-        Arrangement:
-        Mock storage with empty data to isolate route testing.
-
-        Action:
-        HTTP GET request to root path.
-
-        Assertion Strategy:
-        Validates HTTP 200 status and text/html content-type header,
-        confirming successful HTML page generation.
-        """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_sessions.return_value = {}
-            mock_storage.load_interactions.return_value = []
-            mock_storage.load_issues.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/")
-            assert response.status_code == 200
-            assert "text/html" in response.headers["content-type"]
+    def test_dashboard_page(self, empty_responses: dict[str, httpx.Response]) -> None:
+        """Verifies dashboard route returns the branded htmx HTML page.
 
-    def test_dashboard_contains_title(self, client: TestClient) -> None:
-        """Verifies dashboard HTML contains the application title.
-
-        Tests that the rendered page includes 'AI Session Tracker'
-        for user identification and branding.
+        Tests that GET / returns HTTP 200 with HTML content type, includes
+        'AI Session Tracker' for branding and references the htmx library
+        for partial page updates. All checks share a single request.
 
         Business context:
-        Clear branding helps users confirm they're on the correct
-        dashboard. Title appears in browser tab and page header.
+        Dashboard is the primary UI for viewing session analytics. Must
+        return valid HTML, identify itself in the browser tab, and load
+        htmx so panels refresh every 30 seconds without a manual reload.
 
         Arrangement:
-        Mock storage with empty data.
+        Empty stub storage via the empty_responses fixture.
 
         Action:
-        HTTP GET request to root path.
+        Reads the cached GET / response.
 
         Assertion Strategy:
-        Validates response text contains expected title string.
+        Validates HTTP 200 status and text/html content-type header, then
+        the title and htmx reference in the decoded body.
         """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_sessions.return_value = {}
-            mock_storage.load_interactions.return_value = []
-            mock_storage.load_issues.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/")
-            assert "AI Session Tracker" in response.text
-
-    def test_dashboard_contains_htmx(self, client: TestClient) -> None:
-        """Verifies dashboard includes htmx library for dynamic updates.
-
-        Tests that the HTML page includes htmx script reference,
-        enabling partial page updates without full reloads.
-
-        Business context:
-        htmx powers live dashboard updates every 30 seconds. Without
-        htmx, the dashboard would require manual refresh.
-
-        Arrangement:
-        Mock storage with empty data.
-
-        Action:
-        HTTP GET request to root path.
-
-        Assertion Strategy:
-        Validates response text contains 'htmx' reference, confirming
-        the library is included in the page.
-        """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_sessions.return_value = {}
-            mock_storage.load_interactions.return_value = []
-            mock_storage.load_issues.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/")
-            assert "htmx" in response.text
+        response = empty_responses["/"]
+        assert response.status_code == 200
+        assert "text/html" in response.headers["content-type"]
+        text = response.text
+        assert "AI Session Tracker" in text
+        assert "htmx" in text
 
 
-class TestPartialRoutes:
-    """Test suite for htmx partial update routes.
+class TestEmptyStorageRoutes:
+    """Test suite for partial and JSON API routes with no tracked data.
 
     Categories:
-    1. Sessions Partial - Session table fragment (1 test)
-    2. ROI Partial - ROI panel fragment (1 test)
-    3. Effectiveness Partial - Effectiveness panel fragment (1 test)
+    1. Panel Fragments - Sessions table, ROI and effectiveness panels (3 cases)
+    2. JSON APIs - Overview structure and text report (2 cases)
 
-    Total: 3 tests verifying partial routes return valid HTML fragments.
+    Total: 3 tests (1 parametrized over the partials) verifying each
+    route renders its content from empty storage.
     """
 
-    def test_sessions_partial(self, client: TestClient) -> None:
-        """Verifies sessions partial returns HTML table fragment.
-
-        Tests the htmx endpoint for updating the sessions list without
-        full page reload.
+    @pytest.mark.parametrize(
+        ("url", "needle"),
+        [
+            ("/partials/sessions", "<table>"),
+            ("/partials/roi", "Productivity"),
+            ("/partials/effectiveness", "Effectiveness"),
+        ],
+    )
+    def test_empty_partial(
+        self, empty_responses: dict[str, httpx.Response], url: str, needle: str
+    ) -> None:
+        """Verifies each panel partial renders from empty storage.
+
+        Tests the htmx endpoints for the sessions table, productivity
+        summary and effectiveness distribution.
 
         Business context:
-        htmx polls /partials/sessions every 30s to update the table.
-        Must return valid HTML table for seamless DOM replacement.
+        htmx polls these partials every 30s. Each must render before any
+        session has been tracked.
 
         Arrangement:
-        Mock storage with empty sessions.
+        Empty stub storage via the empty_responses fixture.
 
         Action:
-        HTTP GET request to /partials/sessions.
+        Reads the cached response for the parametrized URL.
 
         Assertion Strategy:
-        Validates HTTP 200 and presence of <table> tag in response,
-        confirming valid table HTML is returned.
+        Validates HTTP 200 and the panel's marker text in the body.
         """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_sessions.return_value = {}
-            mock_storage.load_interactions.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/partials/sessions")
-            assert response.status_code == 200
-            assert "<table>" in response.text
-
-    def test_roi_partial(self, client: TestClient) -> None:
-        """Verifies ROI partial returns HTML panel fragment.
+        response = empty_responses[url]
+        assert response.status_code == 200
+        assert needle in response.text
 
-        Tests the htmx endpoint for updating the productivity summary panel
-        without full page reload.
+    def test_empty_api_overview(self, empty_responses: dict[str, httpx.Response]) -> None:
+        """Verifies API overview returns its JSON structure from empty storage.
 
         Business context:
-        htmx polls /partials/roi to update productivity metrics in real-time.
-        Panel shows multiplier, time saved, and cost saved.
+        Integrations read /api/overview and rely on its top-level keys
+        existing even before any session has been tracked.
 
         Arrangement:
-        Mock storage with empty sessions and interactions.
+        Empty stub storage via the empty_responses fixture.
 
         Action:
-        HTTP GET request to /partials/roi.
+        Reads the cached /api/overview response.
 
         Assertion Strategy:
-        Validates HTTP 200 and presence of 'Productivity' text in response,
-        confirming the panel content is rendered.
+        Validates HTTP 200 and that the parsed JSON object holds the
+        sessions, roi and effectiveness keys.
         """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_sessions.return_value = {}
-            mock_storage.load_interactions.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/partials/roi")
-            assert response.status_code == 200
-            assert "Productivity" in response.text
-
-    def test_effectiveness_partial(self, client: TestClient) -> None:
-        """Verifies effectiveness partial returns HTML panel fragment.
+        response = empty_responses["/api/overview"]
+        assert response.status_code == 200
+        data = response.json()
+        assert {"sessions", "roi", "effectiveness"} <= data.keys()
 
-        Tests the htmx endpoint for updating the effectiveness
-        distribution panel without full page reload.
+    def test_empty_api_report(self, empty_responses: dict[str, httpx.Response]) -> None:
+        """Verifies API report returns the text summary from empty storage.
 
         Business context:
-        htmx polls /partials/effectiveness to update the star rating
-        distribution bar chart in real-time.
+        The report endpoint feeds text exports; it must return the
+        summary section even with no tracked data.
 
         Arrangement:
-        Mock storage with empty interactions.
+        Empty stub storage via the empty_responses fixture.
 
         Action:
-        HTTP GET request to /partials/effectiveness.
+        Reads the cached /api/report response.
 
         Assertion Strategy:
-        Validates HTTP 200 and presence of 'Effectiveness' text,
-        confirming the panel content is rendered.
+        Validates HTTP 200 and that the parsed JSON's report value
+        contains the SESSION SUMMARY header.
         """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_interactions.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/partials/effectiveness")
-            assert response.status_code == 200
-            assert "Effectiveness" in response.text
+        response = empty_responses["/api/report"]
+        assert response.status_code == 200
+        data = response.json()
+        assert "SESSION SUMMARY" in data["report"]
 
 
 class TestChartRoutes:
     """Test suite for chart image routes.
 
     Categories:
-    1. Effectiveness Chart - Rating distribution visualization (1 test)
-    2. ROI Chart - ROI trend visualization (1 test)
-    3. Timeline Chart - Session timeline visualization (1 test)
+    1. Chart Images - Effectiveness, ROI and timeline charts (1 parametrized test)
 
-    Total: 3 tests verifying chart routes return valid images.
+    Total: 1 parametrized test verifying chart routes return the SVG
+    fallback. matplotlib is hidden so no test pays for real chart rendering.
     """
 
-    def test_effectiveness_chart_route(self, client: TestClient) -> None:
-        """Verifies effectiveness chart route returns image content.
+    @pytest.mark.parametrize(
+        "url",
+        ["/charts/effectiveness.png", "/charts/roi.png", "/charts/timeline.png"],
+    )
+    def test_chart_route(self, empty_responses: dict[str, httpx.Response], url: str) -> None:
+        """Verifies each chart route returns the SVG placeholder image.
 
-        Tests the chart endpoint returns valid image data (PNG or SVG
-        fallback when matplotlib unavailable).
+        Tests the effectiveness distribution, ROI comparison and session
+        timeline endpoints when matplotlib is unavailable.
 
         Business context:
-        Visual charts enhance dashboard usability. Route must return
-        valid image regardless of matplotlib availability.
+        Visual charts enhance dashboard usability. Each route must return
+        a valid image regardless of matplotlib availability.
 
         Arrangement:
-        Mock storage with empty interactions.
+        Empty stub storage and hidden matplotlib via empty_responses.
 
         Action:
-        HTTP GET request to /charts/effectiveness.png.
+        Reads the cached response for the parametrized chart URL.
 
         Assertion Strategy:
-        Validates HTTP 200 and image content-type (either PNG or SVG),
-        confirming valid image is returned.
+        Validates HTTP 200 and SVG content-type, confirming the
+        placeholder is served even with empty data.
         """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_interactions.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/charts/effectiveness.png")
-            assert response.status_code == 200
-            # Either PNG or SVG placeholder
-            assert response.headers["content-type"] in [
-                "image/png",
-                "image/svg+xml",
-            ]
-
-    def test_roi_chart_route(self, client: TestClient) -> None:
-        """Verifies ROI chart route returns image content.
-
-        Tests the ROI chart endpoint returns valid image data
-        for ROI trend visualization.
-
-        Business context:
-        ROI chart shows return on investment over time. Visual
-        trends help stakeholders understand AI value.
+        response = empty_responses[url]
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/svg+xml"
 
-        Arrangement:
-        Mock storage with empty sessions and interactions.
 
-        Action:
-        HTTP GET request to /charts/roi.png.
+@pytest.mark.skipif(not _HAS_MATPLOTLIB, reason="matplotlib not installed")
+@pytest.mark.timeout(30)
+class TestChartRoutesWithMatplotlib:
+    """Test suite for chart image routes rendering real PNGs.
 
-        Assertion Strategy:
-        Validates HTTP 200 status, confirming chart generation
-        succeeds even with empty data.
-        """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_sessions.return_value = {}
-            mock_storage.load_interactions.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/charts/roi.png")
-            assert response.status_code == 200
+    Categories:
+    1. Chart Images - Effectiveness, ROI and timeline PNGs (1 parametrized test)
 
-    def test_timeline_chart_route(self, client: TestClient) -> None:
-        """Verifies timeline chart route returns image content.
+    Total: 1 parametrized test, skipped without matplotlib. TestChartRoutes
+    covers the SVG fallback; this suite covers the matplotlib render path.
+    The 30s timeout leaves room for matplotlib's first-run font cache.
+    """
 
-        Tests the timeline chart endpoint returns valid image data
-        for session timeline visualization.
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+    @pytest.mark.parametrize(
+        "stub_storage",
+        [
+            _StubStorage()
+            .with_sessions(**_SAMPLE_SESSIONS)
+            .with_interactions(*_SAMPLE_INTERACTIONS),
+        ],
+        indirect=True,
+    )
+    @pytest.mark.parametrize(
+        "url",
+        ["/charts/effectiveness.png", "/charts/roi.png", "/charts/timeline.png"],
+    )
+    @pytest.mark.usefixtures("stub_storage")
+    async def test_chart_route_renders_png(self, aclient: httpx.AsyncClient, url: str) -> None:
+        """Verifies each chart route returns a matplotlib-rendered PNG.
+
+        Tests the effectiveness distribution, ROI comparison and session
+        timeline endpoints with matplotlib importable.
 
         Business context:
-        Timeline shows session activity over time. Helps identify
-        patterns in AI usage and productivity.
+        With matplotlib installed, users get real charts rather than the
+        placeholder. A render regression would otherwise be hidden behind
+        the fallback's HTTP 200.
 
         Arrangement:
-        Mock storage with empty sessions.
+        Stub storage seeded with _SAMPLE_SESSIONS and
+        _SAMPLE_INTERACTIONS; the real ChartPresenter renders from it.
 
         Action:
-        HTTP GET request to /charts/timeline.png.
+        HTTP GET request to the parametrized chart URL.
 
         Assertion Strategy:
-        Validates HTTP 200 status, confirming chart generation
-        succeeds even with empty data.
+        Validates HTTP 200, PNG content-type and the PNG file signature
+        at the start of the body.
         """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_sessions.return_value = {}
-            mock_get.return_value = mock_storage
-
-            response = client.get("/charts/timeline.png")
-            assert response.status_code == 200
+        response = await aclient.get(url)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.content.startswith(_PNG_SIGNATURE)
 
 
 class TestAPIRoutes:
     """Test suite for JSON API routes.
 
     Categories:
-    1. Overview API - Dashboard data endpoint (2 tests)
-    2. Report API - Text report endpoint (1 test)
+    1. Overview API - Session serialization with tracked data (1 test)
 
-    Total: 3 tests verifying API routes return valid JSON.
+    Total: 1 test verifying API routes return stored data as JSON. The
+    empty-storage API cases live in TestEmptyStorageRoutes.
     """
 
-    def test_api_overview(self, client: TestClient) -> None:
-        """Verifies API overview returns JSON with expected structure.
-
-        Tests the primary data endpoint returns valid JSON containing
-        sessions, ROI, and effectiveness data.
-
-        Business context:
-        API enables programmatic access to dashboard data. Structure
-        must be stable for client integrations.
-
-        Arrangement:
-        Mock storage with empty data.
-
-        Action:
-        HTTP GET request to /api/overview.
-
-        Assertion Strategy:
-        Validates HTTP 200, JSON parse success, and presence of
-        required keys (sessions, roi, effectiveness).
-        """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_sessions.return_value = {}
-            mock_storage.load_interactions.return_value = []
-            mock_storage.load_issues.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/api/overview")
-            assert response.status_code == 200
-            data = response.json()
-            assert "sessions" in data
-            assert "roi" in data
-            assert "effectiveness" in data
-
-    def test_api_overview_with_sessions(self, client: TestClient) -> None:
+    @pytest.mark.parametrize(
+        "stub_storage",
+        [
+            _StubStorage()
+            .with_sessions(**_SAMPLE_SESSIONS)
+            .with_interactions(*_SAMPLE_INTERACTIONS),
+        ],
+        indirect=True,
+    )
+    @pytest.mark.usefixtures("stub_storage")
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_api_overview_with_sessions(self, aclient: httpx.AsyncClient) -> None:
         """Verifies API overview includes session data when present.
 
         Tests that sessions are correctly serialized and included
@@ -668,68 +896,54 @@ class TestAPIRoutes:
         other metadata must be accessible to clients.
 
         Arrangement:
-        Mock storage with one completed session and interaction.
+        Stub storage built with with_sessions(**_SAMPLE_SESSIONS) and
+        with_interactions(*_SAMPLE_INTERACTIONS).
 
         Action:
         HTTP GET request to /api/overview.
 
         Assertion Strategy:
-        Validates sessions array has one entry and project field
-        matches the mock data.
+        Validates HTTP 200 and, from a single JSON decode, that the
+        sessions array holds exactly the stubbed project.
         """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_sessions.return_value = {
-                "s1": {
-                    "project": "myproject",
-                    "status": "completed",
-                    "start_time": "2024-01-01T10:00:00Z",
-                    "end_time": "2024-01-01T11:00:00Z",
-                }
-            }
-            mock_storage.load_interactions.return_value = [
-                {"session_id": "s1", "effectiveness_rating": 5}
-            ]
-            mock_storage.load_issues.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/api/overview")
-            data = response.json()
-            assert len(data["sessions"]) == 1
-            assert data["sessions"][0]["project"] == "myproject"
-
-    def test_api_report(self, client: TestClient) -> None:
-        """Verifies API report returns JSON with text report.
-
-        Tests that the report endpoint returns a formatted text
-        report suitable for display or logging.
+        response = await aclient.get("/api/overview")
+        assert response.status_code == 200
+        sessions = response.json()["sessions"]
+        assert [s["project"] for s in sessions] == ["myproject"]
+
+
+class TestConcurrentProbes:
+    """Test suite probing read-only routes concurrently.
+
+    Categories:
+    1. Availability - Dashboard, partial, chart and API routes respond (1 test)
+
+    Total: 1 smoketest over the responses gathered by empty_responses.
+    """
+
+    def test_read_only_routes_respond(self, empty_responses: dict[str, httpx.Response]) -> None:
+        """Verifies every read-only route answers HTTP 200.
+
+        The empty_responses fixture drives the ASGI app in-process and fires
+        all probes with asyncio.gather, so they share one event loop and
+        each route is dispatched once for this test and the content tests.
 
         Business context:
-        Text report provides human-readable analytics summary. Used
-        by CLI and can be logged or emailed.
+        The dashboard page and its htmx partials poll these routes. Any
+        route failing would leave a blank panel in the UI.
 
         Arrangement:
-        Mock storage with empty data.
+        Empty stub storage and hidden matplotlib via empty_responses.
 
         Action:
-        HTTP GET request to /api/report.
+        Collects the status code of each response in _SMOKE_URLS.
 
         Assertion Strategy:
-        Validates HTTP 200, JSON contains 'report' key, and report
-        text contains expected section headers.
+        Validates each response status is 200, keyed by URL so a failure
+        names the offending route.
         """
-        with patch("ai_session_tracker_mcp.web.routes.get_storage") as mock_get:
-            mock_storage = MagicMock(spec=StorageManager)
-            mock_storage.load_sessions.return_value = {}
-            mock_storage.load_interactions.return_value = []
-            mock_storage.load_issues.return_value = []
-            mock_get.return_value = mock_storage
-
-            response = client.get("/api/report")
-            assert response.status_code == 200
-            data = response.json()
-            assert "report" in data
-            assert "SESSION SUMMARY" in data["report"] or "ANALYTICS" in data["report"]
+        statuses = {url: r.status_code for url, r in empty_responses.items()}
+        assert statuses == dict.fromkeys(_SMOKE_URLS, 200)
 
 
 class TestRunDashboard:
@@ -761,8 +975,6 @@ class TestRunDashboard:
         Assertion Strategy:
         Validates function is callable, confirming API contract.
         """
-        from ai_session_tracker_mcp.web import run_dashboard
-
         assert callable(run_dashboard)
 
     def test_run_dashboard_calls_uvicorn(self) -> None:
@@ -776,67 +988,78 @@ class TestRunDashboard:
         Default is localhost:8080 but CLI allows customization.
 
         Arrangement:
-        Mock uvicorn.run to capture call arguments.
+        Create a list-appending stub runner to capture call arguments.
 
         Action:
-        Call run_dashboard with custom host and port.
+        Call run_dashboard with custom host and port, injecting the stub.
 
         Assertion Strategy:
-        Validates uvicorn.run was called once with matching host
+        Validates the runner was called once with matching host
         and port in keyword arguments.
 
         Testing Principle:
         Validates configuration passthrough to ASGI server.
         """
-        from ai_session_tracker_mcp.web.app import run_dashboard
-
-        with patch("ai_session_tracker_mcp.web.app.uvicorn.run") as mock_run:
-            run_dashboard(host="0.0.0.0", port=9000)
-            mock_run.assert_called_once()
-            call_kwargs = mock_run.call_args[1]
-            assert call_kwargs["host"] == "0.0.0.0"
-            assert call_kwargs["port"] == 9000
+        calls: list[dict[str, object]] = []
+        run_dashboard(host="0.0.0.0", port=9000, _runner=lambda *_, **kw: calls.append(kw))
+        assert len(calls) == 1
+        assert calls[0]["host"] == "0.0.0.0"
+        assert calls[0]["port"] == 9000
 
 
 class TestHtmxPartialRoutes:
     """Test suite for htmx partial update routes."""
 
-    def test_gaps_partial_returns_html(self, client: TestClient) -> None:
-        """Verifies gaps partial endpoint returns HTML fragment.
-
-        Tests that the htmx partial for gaps panel returns proper
-        HTML that can be injected into the page.
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+    @pytest.mark.parametrize(
+        ("stub_presenter", "url", "needle"),
+        [
+            ({"get_session_gaps": _SAMPLE_GAPS_VIEWMODEL}, "/partials/gaps", b"Session Gaps"),
+            ({"get_roi_summary": _SAMPLE_ROI_VIEWMODEL}, "/partials/roi", b"Productivity"),
+            (
+                {"get_effectiveness": _SAMPLE_EFFECTIVENESS_VIEWMODEL},
+                "/partials/effectiveness",
+                b"Effectiveness",
+            ),
+        ],
+        indirect=["stub_presenter"],
+        ids=["gaps", "roi", "effectiveness"],
+    )
+    @pytest.mark.usefixtures("stub_presenter")
+    async def test_panel_partial_returns_html(
+        self, aclient: httpx.AsyncClient, url: str, needle: bytes
+    ) -> None:
+        """Verifies each panel partial renders its presenter view model.
+
+        Tests that the htmx partials for the gaps, ROI and effectiveness
+        panels return HTML fragments built from the presenter's data.
 
         Business context:
             htmx uses partials to update specific page sections without
-            full page reload. Must return valid HTML fragments.
+            full page reload. Gaps, ROI and effectiveness are the headline
+            metric panels and must render as valid HTML fragments.
 
         Arrangement:
-            Mock presenter to return SessionGapsViewModel with test data.
+            stub_presenter returns the matching module-level sample view
+            model from the panel's presenter method.
 
         Action:
-            GET /partials/gaps endpoint.
+            GET the parametrized partial endpoint.
 
         Assertion Strategy:
-            Validates 200 status and "Session Gaps" in response text.
+            Validates 200 status and the panel's heading or metric label
+            in the raw response bytes.
         """
-        with patch("ai_session_tracker_mcp.web.routes.get_dashboard_presenter") as mock_get:
-            from ai_session_tracker_mcp.presenters import SessionGapsViewModel
-
-            mock_presenter = MagicMock()
-            mock_presenter.get_session_gaps.return_value = SessionGapsViewModel(
-                total_gaps=3,
-                average_gap_minutes=15.0,
-                by_classification={"quick": 1, "normal": 2},
-                friction_indicators=[],
-            )
-            mock_get.return_value = mock_presenter
-
-            response = client.get("/partials/gaps")
-            assert response.status_code == 200
-            assert "Session Gaps" in response.text
-
-    def test_gaps_partial_with_friction_indicators(self) -> None:
+        response = await aclient.get(url)
+        assert response.status_code == 200
+        assert needle in response.content
+
+    @pytest.mark.parametrize(
+        "stub_presenter", [{"get_session_gaps": _FRICTION_GAPS_VIEWMODEL}], indirect=True
+    )
+    @pytest.mark.usefixtures("stub_presenter")
+    async def test_gaps_partial_with_friction_indicators(self, aclient: httpx.AsyncClient) -> None:
         """Verifies gaps partial shows friction warnings when present.
 
         Tests that friction indicators from the presenter are rendered
@@ -847,7 +1070,7 @@ class TestHtmxPartialRoutes:
             be visible to users in the dashboard.
 
         Arrangement:
-            Mock presenter to return SessionGapsViewModel with friction.
+            Stub presenter returning SessionGapsViewModel with friction.
 
         Action:
             GET /partials/gaps with friction indicators in data.
@@ -855,31 +1078,15 @@ class TestHtmxPartialRoutes:
         Assertion Strategy:
             Validates "long-break ratio" or "warning" appears in HTML.
         """
-        from fastapi.testclient import TestClient as TC
-
-        from ai_session_tracker_mcp.presenters import SessionGapsViewModel
-        from ai_session_tracker_mcp.web import create_app
-        from ai_session_tracker_mcp.web.routes import get_dashboard_presenter
-
-        app = create_app()
-        mock_presenter = MagicMock()
-        mock_presenter.get_session_gaps.return_value = SessionGapsViewModel(
-            total_gaps=5,
-            average_gap_minutes=90.0,
-            by_classification={"long_break": 3, "normal": 2},
-            friction_indicators=[
-                "High long-break ratio (60%)",
-                "Average gap exceeds 60 minutes",
-            ],
-        )
-        app.dependency_overrides[get_dashboard_presenter] = lambda: mock_presenter
-
-        with TC(app) as test_client:
-            response = test_client.get("/partials/gaps")
-            assert response.status_code == 200
-            assert "long-break ratio" in response.text or "warning" in response.text.lower()
+        response = await aclient.get("/partials/gaps")
+        assert response.status_code == 200
+        assert _FRICTION_RE.search(response.content)
 
-    def test_sessions_partial_renders_session_rows(self) -> None:
+    @pytest.mark.parametrize(
+        "stub_presenter", [{"get_sessions_list": [_SAMPLE_SESSION_VIEWMODEL]}], indirect=True
+    )
+    @pytest.mark.usefixtures("stub_presenter")
+    async def test_sessions_partial_renders_session_rows(self, aclient: httpx.AsyncClient) -> None:
         """Verifies sessions partial renders actual session data.
 
         Tests that session data from the presenter is properly
@@ -890,7 +1097,7 @@ class TestHtmxPartialRoutes:
             display session details correctly.
 
         Arrangement:
-            Mock presenter to return SessionViewModel with test session.
+            Stub presenter returning SessionViewModel with test session.
 
         Action:
             GET /partials/sessions with session data.
@@ -898,35 +1105,15 @@ class TestHtmxPartialRoutes:
         Assertion Strategy:
             Validates session ID and "completed" appear in response.
         """
-        from fastapi.testclient import TestClient as TC
-
-        from ai_session_tracker_mcp.presenters import SessionViewModel
-        from ai_session_tracker_mcp.web import create_app
-        from ai_session_tracker_mcp.web.routes import get_dashboard_presenter
-
-        app = create_app()
-        mock_presenter = MagicMock()
-        mock_presenter.get_sessions_list.return_value = [
-            SessionViewModel(
-                session_id="session-abc-123-xyz",
-                project="test-project",
-                status="completed",
-                duration_minutes=90.0,
-                interaction_count=5,
-                effectiveness_avg=4.0,
-                start_time="2024-01-01T10:00:00Z",
-                end_time="2024-01-01T11:30:00Z",
-            )
-        ]
-        app.dependency_overrides[get_dashboard_presenter] = lambda: mock_presenter
-
-        with TC(app) as test_client:
-            response = test_client.get("/partials/sessions")
-            assert response.status_code == 200
-            assert "session-abc" in response.text
-            assert "completed" in response.text.lower()
-
-    def test_sessions_partial_returns_html(self, client: TestClient) -> None:
+        response = await aclient.get("/partials/sessions")
+        assert response.status_code == 200
+        body = response.content
+        assert b"session-abc" in body
+        assert _COMPLETED_RE.search(body)
+
+    @pytest.mark.parametrize("stub_presenter", [{"get_sessions_list": []}], indirect=True)
+    @pytest.mark.usefixtures("stub_presenter")
+    async def test_sessions_partial_returns_html(self, aclient: httpx.AsyncClient) -> None:
         """Verifies sessions partial endpoint returns HTML table fragment.
 
         Tests that the htmx partial for sessions table returns proper
@@ -937,7 +1124,7 @@ class TestHtmxPartialRoutes:
             full page reload. Must return valid HTML fragments.
 
         Arrangement:
-            Mock presenter to return empty sessions list.
+            Stub presenter returning an empty sessions list.
 
         Action:
             GET /partials/sessions endpoint.
@@ -945,143 +1132,67 @@ class TestHtmxPartialRoutes:
         Assertion Strategy:
             Validates 200 status and table or "no sessions" in response.
         """
-        with patch("ai_session_tracker_mcp.web.routes.get_dashboard_presenter") as mock_get:
-            mock_presenter = MagicMock()
-            mock_presenter.get_sessions_list.return_value = []
-            mock_get.return_value = mock_presenter
-
-            response = client.get("/partials/sessions")
-            assert response.status_code == 200
-            assert "table" in response.text.lower() or "no sessions" in response.text.lower()
-
-    def test_roi_partial_returns_html(self, client: TestClient) -> None:
-        """Verifies ROI partial endpoint returns HTML panel fragment.
-
-        Tests that the htmx partial for ROI panel returns proper
-        HTML with summary metrics.
-
-        Business context:
-            ROI panel shows cost savings - critical business metric.
-
-        Arrangement:
-            Mock presenter to return ROIViewModel with test metrics.
-
-        Action:
-            GET /partials/roi endpoint.
-
-        Assertion Strategy:
-            Validates 200 status and "ROI" in response text.
-        """
-        with patch("ai_session_tracker_mcp.web.routes.get_dashboard_presenter") as mock_get:
-            from ai_session_tracker_mcp.presenters import ROIViewModel
-
-            mock_presenter = MagicMock()
-            mock_presenter.get_roi_summary.return_value = ROIViewModel(
-                roi_percentage=150.0,
-                total_sessions=5,
-                completed_sessions=4,
-                total_ai_hours=5.0,
-                estimated_human_hours=10.0,
-                time_saved_hours=5.0,
-                human_baseline_cost=1000.0,
-                total_ai_cost=500.0,
-                cost_saved=500.0,
-                productivity_multiplier=2.0,
-            )
-            mock_get.return_value = mock_presenter
-
-            response = client.get("/partials/roi")
-            assert response.status_code == 200
-            assert "Productivity" in response.text
-
-    def test_effectiveness_partial_returns_html(self, client: TestClient) -> None:
-        """Verifies effectiveness partial endpoint returns HTML panel fragment.
-
-        Tests that the htmx partial for effectiveness panel returns proper
-        HTML with rating distribution.
-
-        Business context:
-            Effectiveness distribution shows AI quality metrics.
-
-        Arrangement:
-            Mock presenter to return EffectivenessViewModel.
-
-        Action:
-            GET /partials/effectiveness endpoint.
-
-        Assertion Strategy:
-            Validates 200 status and "Effectiveness" in response text.
-        """
-        with patch("ai_session_tracker_mcp.web.routes.get_dashboard_presenter") as mock_get:
-            from ai_session_tracker_mcp.presenters import EffectivenessViewModel
-
-            mock_presenter = MagicMock()
-            mock_presenter.get_effectiveness.return_value = EffectivenessViewModel(
-                average=4.2,
-                total_interactions=10,
-                distribution={5: 5, 4: 3, 3: 2},
-            )
-            mock_get.return_value = mock_presenter
-
-            response = client.get("/partials/effectiveness")
-            assert response.status_code == 200
-            assert "Effectiveness" in response.text
-
-    def test_roi_chart_partial_returns_html_with_timestamp(self, client: TestClient) -> None:
-        """Verifies ROI chart partial includes cache-busting timestamp.
-
-        Tests that the img src includes a timestamp parameter to
-        prevent browser caching of stale chart images.
+        response = await aclient.get("/partials/sessions")
+        assert response.status_code == 200
+        assert _TABLE_OR_EMPTY_RE.search(response.content)
+
+    @pytest.mark.parametrize(
+        ("url", "title", "img_src"),
+        [
+            ("/partials/roi-chart", b"ROI Chart", b"roi.png?t="),
+            ("/partials/timeline-chart", b"Timeline", b"timeline.png?t="),
+        ],
+    )
+    async def test_chart_partial_returns_html_with_timestamp(
+        self, aclient: httpx.AsyncClient, url: str, title: bytes, img_src: bytes
+    ) -> None:
+        """Verifies chart partials include a cache-busting timestamp.
+
+        Tests that the img src of the ROI and timeline chart panels
+        includes a timestamp parameter to prevent browser caching of
+        stale chart images.
 
         Business context:
             Charts must refresh with current data. Cache-busting ensures
             users see latest metrics, not cached old charts.
 
         Arrangement:
-            Client fixture provides TestClient for HTTP requests.
-
-        Action:
-            GET /partials/roi-chart endpoint.
-
-        Assertion Strategy:
-            Validates "ROI Chart" and "roi.png?t=" timestamp in response.
-
-        Testing Principle:
-            Cache invalidation - verifies timestamp prevents stale data.
-        """
-        response = client.get("/partials/roi-chart")
-        assert response.status_code == 200
-        assert "ROI Chart" in response.text
-        assert "roi.png?t=" in response.text
-
-    def test_timeline_chart_partial_returns_html_with_timestamp(self, client: TestClient) -> None:
-        """Verifies timeline chart partial includes cache-busting timestamp.
-
-        Tests that the img src includes a timestamp parameter.
-
-        Arrangement:
-            Client fixture provides TestClient for HTTP requests.
+            aclient fixture drives the app in-process.
 
         Action:
-            GET /partials/timeline-chart endpoint.
+            GET the parametrized chart partial endpoint.
 
         Assertion Strategy:
-            Validates "Timeline" and "timeline.png?t=" in response.
+            Validates the panel title and "<chart>.png?t=" in the raw
+            response bytes, skipping a full-body text decode.
 
         Testing Principle:
             Cache invalidation - verifies timestamp prevents stale data.
         """
-        response = client.get("/partials/timeline-chart")
+        response = await aclient.get(url)
         assert response.status_code == 200
-        assert "Timeline" in response.text
-        assert "timeline.png?t=" in response.text
+        body = response.content
+        assert title in body
+        assert img_src in body
 
 
 class TestChartFallbacks:
     """Test suite for chart routes when matplotlib is unavailable."""
 
-    def test_effectiveness_chart_fallback(self) -> None:
-        """Verifies effectiveness chart returns SVG placeholder when matplotlib unavailable.
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+    @pytest.mark.parametrize(
+        ("url", "needle"),
+        [
+            ("/charts/effectiveness.png", b"Effectiveness Chart"),
+            ("/charts/roi.png", b"ROI Chart"),
+            ("/charts/timeline.png", b"Timeline Chart"),
+        ],
+    )
+    async def test_chart_fallback(
+        self, client: TestClient, aclient: httpx.AsyncClient, url: str, needle: bytes
+    ) -> None:
+        """Verifies each chart returns an SVG placeholder when matplotlib is unavailable.
 
         Tests graceful degradation when matplotlib is not installed,
         returning an informative SVG placeholder instead.
@@ -1091,134 +1202,59 @@ class TestChartFallbacks:
             showing placeholder instead of broken images.
 
         Arrangement:
-            Mock chart presenter to raise ImportError on render.
+            Chart presenter overridden with _MatplotlibMissingPresenter,
+            whose render methods raise ImportError.
 
         Action:
-            GET /charts/effectiveness.png without matplotlib.
+            GET the parametrized chart URL without matplotlib.
 
         Assertion Strategy:
-            Validates SVG content-type and "Effectiveness Chart" text.
-        """
-        from fastapi.testclient import TestClient as TC
-
-        from ai_session_tracker_mcp.web import create_app
-        from ai_session_tracker_mcp.web.routes import get_chart_presenter
-
-        app = create_app()
-        mock_presenter = MagicMock()
-        mock_presenter.render_effectiveness_chart.side_effect = ImportError("No matplotlib")
-        app.dependency_overrides[get_chart_presenter] = lambda: mock_presenter
-
-        with TC(app) as test_client:
-            response = test_client.get("/charts/effectiveness.png")
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "image/svg+xml"
-            assert b"Effectiveness Chart" in response.content
-
-    def test_roi_chart_fallback(self) -> None:
-        """Verifies ROI chart returns SVG placeholder when matplotlib unavailable.
-
-        Arrangement:
-            1. Create FastAPI app with dependency injection.
-            2. Override chart presenter to raise ImportError on render.
-
-        Action:
-            GET /charts/roi.png without matplotlib available.
-
-        Assertion Strategy:
-            Validates SVG content-type and "ROI Chart" text.
+            Validates SVG content-type and the chart's title in the body.
 
         Testing Principle:
             Graceful degradation - ensures charts display placeholder when libs missing.
         """
-        from fastapi.testclient import TestClient as TC
-
-        from ai_session_tracker_mcp.web import create_app
-        from ai_session_tracker_mcp.web.routes import get_chart_presenter
-
-        app = create_app()
-        mock_presenter = MagicMock()
-        mock_presenter.render_roi_chart.side_effect = ImportError("No matplotlib")
-        app.dependency_overrides[get_chart_presenter] = lambda: mock_presenter
-
-        with TC(app) as test_client:
-            response = test_client.get("/charts/roi.png")
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "image/svg+xml"
-            assert b"ROI Chart" in response.content
-
-    def test_timeline_chart_fallback(self) -> None:
-        """Verifies timeline chart returns SVG placeholder when matplotlib unavailable.
-
-        Arrangement:
-            1. Create FastAPI app with dependency injection.
-            2. Override chart presenter to raise ImportError on timeline render.
-
-        Action:
-            GET /charts/timeline.png without matplotlib available.
-
-        Assertion Strategy:
-            Validates SVG content-type and "Timeline Chart" text.
-
-        Testing Principle:
-            Graceful degradation - ensures timeline displays placeholder when libs missing.
-        """
-        from fastapi.testclient import TestClient as TC
-
-        from ai_session_tracker_mcp.web import create_app
-        from ai_session_tracker_mcp.web.routes import get_chart_presenter
-
-        app = create_app()
-        mock_presenter = MagicMock()
-        mock_presenter.render_sessions_timeline.side_effect = ImportError("No matplotlib")
-        app.dependency_overrides[get_chart_presenter] = lambda: mock_presenter
-
-        with TC(app) as test_client:
-            response = test_client.get("/charts/timeline.png")
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "image/svg+xml"
-            assert b"Timeline Chart" in response.content
+        with _override_dependency(client, get_chart_presenter, _MatplotlibMissingPresenter()):
+            response = await aclient.get(url)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/svg+xml"
+        assert needle in response.content
 
 
 class TestAppMainBlock:
     """Test suite for web app __main__ block."""
 
-    def test_main_block_runs_dashboard(self) -> None:
-        """Verifies __main__ block calls run_dashboard when executed directly.
+    def test_main_block_runs_dashboard(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies the __main__ entry point starts the dashboard with defaults.
 
-        Tests that running the app module as a script starts the
-        dashboard server with default settings.
+        Tests _main(), the function the if __name__ == '__main__' block
+        calls, instead of re-executing the module through runpy.
 
         Business context:
-            Users may run `python -m ai_session_tracker_mcp.web.app`
-            directly. Should start dashboard on default host/port.
+        Direct execution via `python -m ai_session_tracker_mcp.web.app`
+        should start the dashboard server for quick development testing.
 
         Arrangement:
-            1. Patch run_dashboard to prevent actual server startup.
-            2. Access module to verify callable structure.
+        Stub uvicorn.run, which run_dashboard imports lazily, to prevent
+        actual server startup.
 
         Action:
-            Verify run_dashboard function exists and is callable.
+        Call web.app._main().
 
         Assertion Strategy:
-            Validates callable check passes.
-
-        Testing Principle:
-            Module entrypoint - ensures direct script execution is functional.
+        Validates uvicorn.run was called with the expected factory config
+        and run_dashboard's default host, port, reload and log level.
         """
-        with patch("ai_session_tracker_mcp.web.app.run_dashboard"):
-            # Execute the module's __main__ guard
-            import sys
-
-            # Temporarily make the module think it's __main__
-            original_name = "ai_session_tracker_mcp.web.app"
-            if original_name in sys.modules:
-                del sys.modules[original_name]
-
-            # Use runpy to execute as __main__
-
-            with patch.dict("sys.modules", {"ai_session_tracker_mcp.web.app": MagicMock()}):
-                # Just verify the function exists and is callable
-                from ai_session_tracker_mcp.web.app import run_dashboard
-
-                assert callable(run_dashboard)
+        mock_uvicorn = MagicMock()
+        monkeypatch.setattr("uvicorn.run", mock_uvicorn)
+
+        web_app._main()
+
+        mock_uvicorn.assert_called_once_with(
+            "ai_session_tracker_mcp.web.app:create_app",
+            factory=True,
+            host="127.0.0.1",
+            port=8000,
+            reload=False,
+            log_level="info",
+        )